@@ -28,7 +28,8 @@ Examples
 # For Python versions between 3.7 to 3.9, we need the following line:
 from __future__ import annotations
 import socket
-from abc import ABC, abstractmethod
+import sys
+from types import MappingProxyType
 from colorama import Fore, Style, init as colorma_init
 from typing import Union
 
@@ -38,28 +39,46 @@ from typing import Union
 
 
 DATA_DELIMETER = '#'
-FIELDS_DELIMETER = '|'
-CMD_SUFFIX_CHAR = ' '
+FIELDS_DELIMETER = b'|'
+FIELDS_DELIMETER_CODE = FIELDS_DELIMETER[0]
+CMD_SUFFIX_CHAR = b' '
 CMD_FIELD_LENGTH = 16
 LEN_FIELD_LENGTH = 4
 CMD_FIELD_MAX_LENGTH = 16
 DATA_FIELD_MAX_LENGTH = 10 ** LEN_FIELD_LENGTH - 1
-MESSAGE_PARTS = 3
+LEN_FIELD_OFFSET = CMD_FIELD_LENGTH + 1
+HEADER_LENGTH = LEN_FIELD_OFFSET + LEN_FIELD_LENGTH + 1
+"""Length of the fixed-width `CMD|LEN|` header, which comes before the data field"""
+MESSAGE_FORMAT = b'%%s%s%%0%dd%s%%s' % (FIELDS_DELIMETER, LEN_FIELD_LENGTH, FIELDS_DELIMETER)
+"""A bytes-format of a whole message: the padded cmd, the data length and the data"""
+MESSAGE_MAX_LENGTH = HEADER_LENGTH + DATA_FIELD_MAX_LENGTH
+"""Length of the longest message the protocol allows"""
 NUMBER_OF_ANSWERS = 4
-BUFFER_SIZE = 2 ** 10
-"""Max size of the socket buffer"""
+VALID_ANSWERS = frozenset(range(1, NUMBER_OF_ANSWERS + 1))
+"""All the valid answer numbers (1-4)"""
 SERVER_PORT = 5678
 QUESTION_PRATS_NUM = 6
 LOGGED_USERS_DELIMETER = ','
+QUESTION_KEYS = frozenset(("question", "optional_answers", "answer"))
+"""The keys of a question's dict (see `Question.dict_to_question`)"""
+USER_KEYS = frozenset(("name", "password", "score", "questions_asked"))
+"""The keys of a user's dict (see `User.dict_to_user`)"""
 CHATLIB_ERROR_RETURN = None
+PARSE_ERROR_RETURN = (CHATLIB_ERROR_RETURN, CHATLIB_ERROR_RETURN)
+
+# Colors of the prints:
+_BLUE_PREFIX = Fore.LIGHTBLUE_EX
+_RED_PREFIX = Fore.LIGHTRED_EX
+_RESET = Style.RESET_ALL
 
 
 # ====================
 
 # ===== Protocol Constants:
 
+# All the protocol tables are read-only views, as they must never change at runtime.
 
-SUCCESS_PRINT_CLIENT = {
+SUCCESS_PRINT_CLIENT = MappingProxyType({
     "login": "Logged in!",
     "logout": "Goodbye",
     "get_score": " Getting score",
@@ -67,9 +86,9 @@ SUCCESS_PRINT_CLIENT = {
     "get_question": " Getting question",
     "send_answer": "Sending answer",
     "get_logged_users": "Getting logged users"
-}
+})
 
-PROTOCOL_CLIENT = {
+PROTOCOL_CLIENT = MappingProxyType({
     "login": "LOGIN",
     "logout": "LOGOUT",
     "get_score": "MY_SCORE",
@@ -77,9 +96,9 @@ PROTOCOL_CLIENT = {
     "get_question": "GET_QUESTION",
     "send_answer": "SEND_ANSWER",
     "get_logged_users": "LOGGED"
-}
+})
 
-PROTOCOL_SERVER_OK = {
+PROTOCOL_SERVER_OK = MappingProxyType({
     "login": "LOGIN_OK",
     "get_score": "YOUR_SCORE",
     "get_highscore": "ALL_SCORE",
@@ -87,14 +106,43 @@ PROTOCOL_SERVER_OK = {
     "send_answer_correct": "CORRECT_ANSWER",
     "send_answer_wrong": "WRONG_ANSWER",
     "get_logged_users": "LOGGED_ANSWER"
-}
+})
 
 PROTOCOL_SERVER_ERROR = "ERROR"
 
+PADDED_CMDS = MappingProxyType({
+    cmd: cmd.encode().ljust(CMD_FIELD_LENGTH, CMD_SUFFIX_CHAR)
+    for cmd in {*PROTOCOL_CLIENT.values(), *PROTOCOL_SERVER_OK.values(), PROTOCOL_SERVER_ERROR}
+})
+"""All the protocol commands, encoded and padded to the length of the command field"""
+
+PADDED_CMDS_INVERSE = MappingProxyType({padded: cmd for cmd, padded in PADDED_CMDS.items()})
+"""The inverse of `PADDED_CMDS`, from a padded command field back to its protocol command"""
+
 
 # ====================
 # ===== Utility Functions:
 
+
+_colored_print = None
+"""Whether to color the prints (decided on the first print, see `_use_colored_print`)"""
+
+
+def _use_colored_print() -> bool:
+    """
+    Returns whether the prints should be colored - only if the stdout is a terminal.
+
+    On the first call, also initializes `colorama` (if needed), so it is never touched
+    by a process which does not print to a terminal.
+    """
+    global _colored_print
+    if _colored_print is None:
+        _colored_print = sys.stdout.isatty()
+        if _colored_print:
+            init_colored_print()
+    return _colored_print
+
+
 # ====================
 # ===== Library Functions:
 
@@ -108,29 +156,31 @@ def init_colored_print() -> None:
 
 def print_server_msg(s: str) -> None:
     """
-    A convenient way to print the server messgaes, in a blue color.
+    A convenient way to print the server messgaes, in a blue color (if printed to a terminal).
     """
-    print(Fore.LIGHTBLUE_EX + s + Style.RESET_ALL)
+    if _use_colored_print():
+        print(_BLUE_PREFIX, s, _RESET, sep='')
+    else:
+        print(s)
 
 
 def printDebug(s: str) -> None:
     """
-    A convenient way to print errors, for debugging.
+    A convenient way to print errors, for debugging, in a red color (if printed to a terminal).
     """
-    print(Fore.LIGHTRED_EX + s + Style.RESET_ALL)
-
-
-# For colored print:
-init_colored_print()
+    if _use_colored_print():
+        print(_RED_PREFIX, s, _RESET, sep='')
+    else:
+        print(s)
 
 
 # ====================
 # ===== Library Classes:
 
 
-class ProtocolUser(ABC):
+class ProtocolUser:
     """
-    An abstract class represents a TCP client, with the functionality of send and receive data,
+    A base class represents a TCP client, with the functionality of send and receive data,
     according to `chatlib` protocol.
 
     -------
@@ -152,6 +202,10 @@ class ProtocolUser(ABC):
 
     _parse_message(msg)
 
+    _message_length(buf, buffered)
+
+    _pop_message(buf, buffered)
+
     Public Methods
     -------
 
@@ -160,7 +214,8 @@ class ProtocolUser(ABC):
 
     """
 
-    @abstractmethod
+    __slots__ = ('socket',)
+
     def __init__(self) -> None:
         """
         Creates a generic socket, uses the TCP protocol.
@@ -195,15 +250,13 @@ class ProtocolUser(ABC):
         ------
         Raises
         ------
-        - TypeError
-            - If one of the arguments is of a wrong type.
+        - TypeError, AttributeError
+            - If one of the arguments is of a wrong type (raised by the `str` operations).
         """
-        if (not isinstance(data, str)) or (not isinstance(expected_fields, int)):
-            raise TypeError
-        data_list = data.split(DATA_DELIMETER)
-        if len(data_list) != expected_fields:
+        # Count the delimeters first, so no list is built for a wrong number of fields:
+        if data.count(DATA_DELIMETER) != expected_fields - 1:
             return CHATLIB_ERROR_RETURN
-        return data_list
+        return data.split(DATA_DELIMETER, expected_fields - 1)
 
     @staticmethod
     def _join_data(words: Union[list[str], tuple[str]]) -> str:
@@ -225,17 +278,14 @@ class ProtocolUser(ABC):
         Raises
         ------
         - TypeError
-            - If one of the arguments is of a wrong type.
+            - If one of the words is not a string (raised by `str.join`).
         """
-        if not isinstance(words, list) and not isinstance(words, tuple):
-            raise TypeError
-        if not all(isinstance(word, str) for word in words):
-            raise TypeError
         return DATA_DELIMETER.join(words)
 
     @staticmethod
-    def _build_message(cmd: str, msg: str) -> str:
-        """Gets command name (str) and data field (str) and creates a valid protocol message
+    def _build_message(cmd: str, msg: str) -> bytes:
+        """Gets command name (str) and data field (str) and creates a valid protocol message,
+        encoded and ready to be sent
 
         ------
         Parameters
@@ -249,35 +299,40 @@ class ProtocolUser(ABC):
         ------
         Returns
         ------
-        - str
-            - A valid protocol message, of format: `CCCCCCCCCCCCCCCC|LLLL|MMM`
+        - bytes
+            - A valid protocol message, of format: `CCCCCCCCCCCCCCCC|LLLL|MMM`.
+            The length field counts the bytes of the encoded data field.
         - None
             - If `cmd` or `msg` does not match the protocol.
 
         ------
         Raises
         ------
-        - TypeError
-            - If one of the arguments is of a wrong type.
-        """
-        if (not isinstance(cmd, str)) or (not isinstance(msg, str)):
-            raise TypeError
-        if (len(cmd) > CMD_FIELD_MAX_LENGTH) or (len(msg) > DATA_FIELD_MAX_LENGTH):
+        - TypeError, AttributeError
+            - If one of the arguments is of a wrong type (raised by the `str` operations).
+        """
+        cmd_field = PADDED_CMDS.get(cmd)
+        if cmd_field is None:
+            # The field's length is counted in bytes, so it is checked only after encoding:
+            cmd_field = cmd.encode()
+            if len(cmd_field) > CMD_FIELD_MAX_LENGTH:
+                return CHATLIB_ERROR_RETURN
+            cmd_field = cmd_field.ljust(CMD_FIELD_LENGTH, CMD_SUFFIX_CHAR)
+        data_field = msg.encode()
+        if len(data_field) > DATA_FIELD_MAX_LENGTH:
             return CHATLIB_ERROR_RETURN
-        cmd_field = cmd.ljust(CMD_FIELD_LENGTH, CMD_SUFFIX_CHAR)
-        data_len_field = str(len(msg)).zfill(LEN_FIELD_LENGTH)
-        data_field = msg
-        return FIELDS_DELIMETER.join([cmd_field, data_len_field, data_field])
+        return MESSAGE_FORMAT % (cmd_field, len(data_field), data_field)
 
     @staticmethod
-    def _parse_message(msg: str) -> Union[tuple[str, str], tuple[None, None]]:
-        """Parses protocol message and returns command name and data field
+    def _parse_message(msg: Union[bytes, bytearray]) -> Union[tuple[str, str], tuple[None, None]]:
+        """Parses protocol message (as received from the socket) and returns command name
+        and data field
 
         ------
         Parameters
         ------
-        msg : str
-            - [description]
+        msg : bytes | bytearray
+            - The raw message, of format: `CCCCCCCCCCCCCCCC|LLLL|MMM`.
 
         ------
         Returns
@@ -290,43 +345,111 @@ class ProtocolUser(ABC):
         ------
         Raises
         ------
-        - TypeError
-            - If one of the arguments is of a wrong type.
+        - TypeError, AttributeError
+            - If `msg` is of a wrong type (raised by the `bytes` operations).
         - ConnectionResetError
             - May raise it if the other side is closed forcibly.
         """
-        # Check type of msg:
-        if not isinstance(msg, str):
-            raise TypeError
-        failure = (CHATLIB_ERROR_RETURN, CHATLIB_ERROR_RETURN)
-        msg_parts = msg.split(FIELDS_DELIMETER)
-        # Check there are 3 strings seperated by the delimeter:
-        if len(msg_parts) != MESSAGE_PARTS:
-            return failure
-        cmd, data_len_str, data = tuple(msg_parts)
-        # Check cmd:
-        if len(cmd) != CMD_FIELD_LENGTH:
+        failure = PARSE_ERROR_RETURN
+        # The header is of a fixed width, so validate it in a single pass over known offsets:
+        if len(msg) < HEADER_LENGTH or msg[CMD_FIELD_LENGTH] != FIELDS_DELIMETER_CODE \
+                or msg[HEADER_LENGTH - 1] != FIELDS_DELIMETER_CODE:
             return failure
         # Check data_len:
-        try:
-            data_len = int(data_len_str)
-        except:
+        data_len_str = msg[LEN_FIELD_OFFSET:HEADER_LENGTH - 1]
+        if not data_len_str.isdigit():
             return failure
+        data_len = int(data_len_str)
         if not 0 <= data_len < DATA_FIELD_MAX_LENGTH:
             return failure
         # Check data:
-        if data_len != len(data):
+        if data_len != len(msg) - HEADER_LENGTH:
             return failure
-        return (cmd.strip(), data)
+        # Only now, when the message is known to be valid, slice and decode its fields:
+        cmd_field = bytes(msg[:CMD_FIELD_LENGTH])
+        try:
+            # A known command maps straight back to its protocol constant, others are interned:
+            cmd = PADDED_CMDS_INVERSE.get(cmd_field) \
+                or sys.intern(cmd_field.rstrip(CMD_SUFFIX_CHAR).decode())
+            return (cmd, msg[HEADER_LENGTH:].decode())
+        except UnicodeDecodeError:
+            return failure
+
+    @staticmethod
+    def _message_length(buf: Union[bytes, bytearray], buffered: int) -> Union[int, None]:
+        """
+        Gets a buffer which starts with a message, and returns the length of that whole message,
+        according to its header.
+
+        ------
+        Parameters
+        ------
+        buf : bytes | bytearray
+            - The buffer. Only its first `buffered` bytes are looked at.
+        buffered : int
+            - How many bytes of the buffer were received.
+
+        ------
+        Returns
+        ------
+        - int
+            - The message length. If the length field is not a number, the message cannot be
+            framed, so all of the `buffered` bytes are considered as one (invalid) message.
+        - None
+            - If the header has not been fully received yet.
+        """
+        if buffered < HEADER_LENGTH:
+            return None
+        data_len_str = buf[LEN_FIELD_OFFSET:HEADER_LENGTH - 1]
+        if not data_len_str.isdigit():
+            return buffered
+        return HEADER_LENGTH + int(data_len_str)
+
+    @staticmethod
+    def _pop_message(buf: bytearray, buffered: int) -> tuple[Union[bytearray, None], int]:
+        """
+        Gets a receive buffer, and takes the first message out of it if it has been fully
+        received. What was received after that message is moved to the start of the buffer.
+
+        (Uses the function `_message_length`).
+
+        ------
+        Parameters
+        ------
+        buf : bytearray
+            - The receive buffer. Only its first `buffered` bytes are looked at.
+        buffered : int
+            - How many bytes of the buffer were received.
+
+        ------
+        Returns
+        ------
+        - tuple[bytearray, int]
+            - (message, buffered) - a copy of just the message's bytes, and how many bytes are
+            left in the buffer after it.
+        - tuple[None, int]
+            - (None, buffered) - if no message has been fully received yet. The buffer is
+            left as it is.
+        """
+        msg_len = ProtocolUser._message_length(buf, buffered)
+        if msg_len is None or msg_len > buffered:
+            return (None, buffered)
+        msg = buf[:msg_len]
+        view = memoryview(buf)
+        view[:buffered - msg_len] = view[msg_len:buffered]
+        return (msg, buffered - msg_len)
 
     def terminate(self) -> None:
         """
-        Closes the socket, using `close` method (for use when the socket is no longer needed).
+        Shuts the socket down (so the other side sees EOF promptly) and then closes it,
+        using `close` method (for use when the socket is no longer needed).
         """
         try:
-            self.socket.close()
-        except:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            # E.g. the socket was never connected, or the other side is already gone.
             pass
+        self.socket.close()
 
 
 class Question:
@@ -360,6 +483,8 @@ class Question:
         Gets an integer between 1-4. Returns whether this is the answer or not.
     """
 
+    __slots__ = ('_question', '_optional_answers', '_answer')
+
     def __init__(self, question: str, optional_answers: tuple[str], answer: int) -> None:
         """
         Creates a new question.
@@ -379,7 +504,7 @@ class Question:
         Raises
         ------
         - TypeError
-            - In case one of the parameters is of inappropriate type.
+            - In case one of the parameters is of inappropriate type (not checked when run with `-O`).
         - ValueError
             - In case the value of one of the parameters is inappropriate.
         """
@@ -395,8 +520,9 @@ class Question:
 
     @question.setter
     def question(self, question: str) -> None:
-        if not isinstance(question, str):
-            raise TypeError
+        if __debug__:
+            if not isinstance(question, str):
+                raise TypeError
         self._question = question
 
     @property
@@ -409,10 +535,11 @@ class Question:
 
     @optional_answers.setter
     def optional_answers(self, optional_answers: tuple[str]) -> None:
-        if not isinstance(optional_answers, tuple):
-            raise TypeError
-        if not all(isinstance(s, str) for s in optional_answers):
-            raise TypeError
+        if __debug__:
+            if not isinstance(optional_answers, tuple):
+                raise TypeError
+            if any(type(s) is not str for s in optional_answers):
+                raise TypeError
         if not len(optional_answers) == NUMBER_OF_ANSWERS:
             raise ValueError
         self._optional_answers = optional_answers
@@ -425,9 +552,10 @@ class Question:
 
     @answer.setter
     def answer(self, answer: int) -> None:
-        if not isinstance(answer, int):
-            raise TypeError
-        if not answer in range(1, NUMBER_OF_ANSWERS + 1):
+        if __debug__:
+            if not isinstance(answer, int):
+                raise TypeError
+        if not answer in VALID_ANSWERS:
             raise ValueError
         self._answer = answer
 
@@ -464,9 +592,10 @@ class Question:
         """
         if not isinstance(question, dict) or len(question) != 3:
             raise TypeError
-        if list(question.keys()) != ["question", "optional_answers", "answer"]:
+        if question.keys() != QUESTION_KEYS:
             raise KeyError
-        return Question(question["question"], tuple(question["optional_answers"]),
+        # Answers such as "True"/"False" repeat across questions, so they are stored only once:
+        return Question(question["question"], tuple(map(sys.intern, question["optional_answers"])),
                         question["answer"])
 
     def question_to_dict(self) -> dict:
@@ -542,9 +671,16 @@ class Question:
         - bool
             - True - if correct.
             - False - if it is not correct.
+        ------
+
+        Raises
+        ------
+        - TypeError
+            - In case one of the parameters is of inappropriate type (not checked when run with `-O`).
         """
-        if not isinstance(answer_num, int):
-            raise TypeError
+        if __debug__:
+            if not isinstance(answer_num, int):
+                raise TypeError
         return answer_num == self._answer
 
 
@@ -574,6 +710,9 @@ class User:
     user_to_dict()
         Returns an appropriate dict for the calling `User` instance.
 
+    questions_asked_copy()
+        Returns a shallow copy of the set of questions_asked.
+
     add_score(score_tp_add)
         Add the given score to the user score.
 
@@ -581,15 +720,17 @@ class User:
         Returns the current score of the user.
 
     mark_question_as_asked(question)
-        Gets a question and add it to the list of questions_asked.
+        Gets a question and add it to the set of questions_asked.
 
     was_question_asked(question)
         Gets a question number and checks whether the user has already been asked
         this question or not.
     """
 
+    __slots__ = ('_name', '_password', '_score', '_questions_asked')
+
     def __init__(self, name: str, password: str, score: int = 0,
-                 questions_asked: Union[list[int], None] = None) -> None:
+                 questions_asked: Union[list[int], set[int], None] = None) -> None:
         """
         Creates a new user.
 
@@ -603,14 +744,14 @@ class User:
             The user password.
         score : int, (default 0)
             The user score.
-        questions_asked : list[int], (default [])
+        questions_asked : list[int] | set[int], (default empty)
             All the questions the user have already been asked.
         ----------
 
         Raises
         ------
         - TypeError
-            - In case one of the parameters is of inappropriate type.
+            - In case one of the parameters is of inappropriate type (not checked when run with `-O`).
         """
         self.name = name
         self.password = password
@@ -625,8 +766,9 @@ class User:
 
     @name.setter
     def name(self, user_name: str) -> None:
-        if not isinstance(user_name, str):
-            raise TypeError
+        if __debug__:
+            if not isinstance(user_name, str):
+                raise TypeError
         self._name = user_name
 
     @property
@@ -637,8 +779,9 @@ class User:
 
     @password.setter
     def password(self, user_password: str) -> None:
-        if not isinstance(user_password, str):
-            raise TypeError
+        if __debug__:
+            if not isinstance(user_password, str):
+                raise TypeError
         self._password = user_password
 
     @property
@@ -649,29 +792,32 @@ class User:
 
     @score.setter
     def score(self, user_score: int) -> None:
-        if not isinstance(user_score, int):
-            raise TypeError
+        if __debug__:
+            if not isinstance(user_score, int):
+                raise TypeError
         # TODO: consider checking the question number...
         self._score = user_score
 
     @property
-    def questions_asked(self) -> list[int]:
-        """:obj:`list`[:obj:`int`]: All the questions the user have already been asked.
+    def questions_asked(self) -> set[int]:
+        """:obj:`set`[:obj:`int`]: All the questions the user have already been asked.
 
-        #### Pay attention: The getter for this property returns a shallow copy of this list.
+        Kept as a set, so marking and looking up a question do not scan the user's history.
+        #### Pay attention: The getter returns the set itself - use `questions_asked_copy` for a copy.
         """
-        return self._questions_asked.copy()
+        return self._questions_asked
 
     @questions_asked.setter
-    def questions_asked(self, user_questions_asked: list[int]) -> None:
+    def questions_asked(self, user_questions_asked: Union[list[int], set[int]]) -> None:
         if user_questions_asked is None:
-            self._questions_asked = []
+            self._questions_asked = set()
         else:
-            if not isinstance(user_questions_asked, list):
-                raise TypeError
-            if not all(isinstance(v, int) for v in user_questions_asked):
-                raise TypeError
-            self._questions_asked = user_questions_asked
+            if __debug__:
+                if not isinstance(user_questions_asked, (list, set)):
+                    raise TypeError
+                if any(type(v) is not int for v in user_questions_asked):
+                    raise TypeError
+            self._questions_asked = set(user_questions_asked)
 
     @classmethod
     def dict_to_user(cls, user: dict[str, ]) -> User:
@@ -706,9 +852,24 @@ class User:
         """
         if not isinstance(user, dict) or len(user) != 4:
             raise TypeError
-        if list(user.keys()) != ["name", "password", "score", "questions_asked"]:
+        if user.keys() != USER_KEYS:
             raise KeyError
-        return User(user["name"], user["password"], user["score"], user["questions_asked"])
+        # The name is kept by several server tables, so they all share the one interned object:
+        return User(sys.intern(user["name"]), user["password"], user["score"],
+                    user["questions_asked"])
+
+    def questions_asked_copy(self) -> set[int]:
+        """
+        Returns a shallow copy of the set of questions the user have already been asked.
+
+        ------
+
+        Returns
+        ------
+        - set[int]
+            - The question numbers.
+        """
+        return self._questions_asked.copy()
 
     def user_to_dict(self) -> dict:
         """
@@ -721,7 +882,7 @@ class User:
             - An appropriate dict.
         """
         return {"name": self._name, "password": self._password,
-                "score": self._score, "questions_asked": self._questions_asked}
+                "score": self._score, "questions_asked": sorted(self._questions_asked)}
 
     def get_name(self) -> str:
         """
@@ -770,11 +931,11 @@ class User:
         Raises
         ------
         - TypeError
-            - In case one of the parameters is of inappropriate type.
+            - In case one of the parameters is of inappropriate type (not checked when run with `-O`).
         """
-
-        if not isinstance(score_to_add, int):
-            raise TypeError
+        if __debug__:
+            if not isinstance(score_to_add, int):
+                raise TypeError
         self._score += score_to_add
         return self._score
 
@@ -793,7 +954,7 @@ class User:
 
     def mark_question_as_asked(self, question: int) -> None:
         """
-        Gets a question and add it to the list of questions_asked.
+        Gets a question and add it to the set of questions_asked.
 
         ------
 
@@ -806,15 +967,13 @@ class User:
         Raises
         ------
         - TypeError
-            - In case one of the parameters is of inappropriate type.
+            - In case one of the parameters is of inappropriate type (not checked when run with `-O`).
         """
-        if not isinstance(question, int):
-            raise TypeError
+        if __debug__:
+            if not isinstance(question, int):
+                raise TypeError
         # TODO: consider checking the question number...
-
-        if question in self._questions_asked:
-            return
-        self._questions_asked.append(question)
+        self._questions_asked.add(question)
 
     def was_question_asked(self, question: int) -> bool:
         """
@@ -839,10 +998,11 @@ class User:
         Raises
         ------
         - TypeError
-            - In case one of the parameters is of inappropriate type.
+            - In case one of the parameters is of inappropriate type (not checked when run with `-O`).
         """
-        if not isinstance(question, int):
-            raise TypeError
+        if __debug__:
+            if not isinstance(question, int):
+                raise TypeError
         return question in self._questions_asked
 
 
@@ -2,8 +2,10 @@
 
 # For Python versions between 3.7 to 3.9, we need the following line:
 from __future__ import annotations
+import socket
 import chatlib
 from typing import Union
+from types import MappingProxyType
 from chatlib import ProtocolUser, PROTOCOL_CLIENT, PROTOCOL_SERVER_OK
 
 
@@ -15,6 +17,15 @@ LOCAL_HOST = "127.0.0.1"  # Our server will run on same computer as client
 SERVER_IP = LOCAL_HOST
 DEFAULT_TIMEOUT = 10
 
+ANSWER_PROMPT = f"Please choose an answer [1-{chatlib.NUMBER_OF_ANSWERS}]: "
+VALID_ANSWER_INPUTS = frozenset(str(answer) for answer in chatlib.VALID_ANSWERS)
+"""The answers a user may type, as typed (checked by one hash lookup per input)."""
+
+CONSTANT_REQUESTS = MappingProxyType({
+    cmd: ProtocolUser._build_message(PROTOCOL_CLIENT[cmd], '')
+    for cmd in ("logout", "get_score", "get_highscore", "get_question", "get_logged_users")})
+"""The messages of all the commands that have no data, built once instead of per request"""
+
 
 # ====================
 # Errors Messages:
@@ -75,6 +86,8 @@ class Client(ProtocolUser):
 
     _parse_message(msg)
 
+    _recv()
+
     _recv_message_and_parse()
 
     _build_and_send_message(cmd, data='')
@@ -88,6 +101,8 @@ class Client(ProtocolUser):
 
     """
 
+    __slots__ = ('_recv_buf', '_recv_view', '_recv_len')
+
     def __init__(self, server_ip: str = SERVER_IP, server_port: int = chatlib.SERVER_PORT) -> None:
         """
         Creates a `Client` by creating a client-socket and connects it to the server, using `connect` method.
@@ -110,12 +125,48 @@ class Client(ProtocolUser):
             - In case of connection failure.
         """
         super().__init__()
+        # Reused by every `_recv`, instead of allocating a new `bytes` for each message.
+        # It can hold the longest message, so a message never has to be received in pieces:
+        self._recv_buf = bytearray(chatlib.MESSAGE_MAX_LENGTH)
+        self._recv_view = memoryview(self._recv_buf)
+        # How many bytes at the start of the buffer were received but not yet returned:
+        self._recv_len = 0
         self.socket.settimeout(DEFAULT_TIMEOUT)
+        # Each request is a small and complete message, so it should not wait for a delayed ACK:
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         # Connect the socket to the server's socket, whith its IP and port:
-        try:
-            self.socket.connect((server_ip, server_port))
-        except ConnectionRefusedError as e:
-            raise e
+        self.socket.connect((server_ip, server_port))
+
+    def _recv(self) -> bytearray:
+        """
+        Receives from the socket, using `recv_into`, until a whole message is buffered.
+        Then, returns that message and keeps any bytes after it for the next call.
+
+        (Uses the function `_pop_message`).
+
+        ------
+        Returns
+        ------
+        - bytearray
+            - The message (a copy of just its bytes, not of the whole buffer). If the server
+            has closed the connection, this is whatever was left in the buffer (maybe empty).
+
+        ------
+        Raises
+        ------
+        - OSError
+            - If `recv_into` failed.
+        """
+        msg, buffered = ProtocolUser._pop_message(self._recv_buf, self._recv_len)
+        while msg is None:
+            received = self.socket.recv_into(self._recv_view[buffered:])
+            if not received:
+                msg, buffered = self._recv_buf[:buffered], 0
+                break
+            buffered += received
+            msg, buffered = ProtocolUser._pop_message(self._recv_buf, buffered)
+        self._recv_len = buffered
+        return msg
 
     def _recv_message_and_parse(self) -> Union[tuple[str, str], tuple[None, None]]:
         """
@@ -138,14 +189,10 @@ class Client(ProtocolUser):
             - If `recv` failed (i.e the syscall is interrupted).
         """
 
-        data = ''
-        try:
-            data = self.socket.recv(chatlib.BUFFER_SIZE).decode()
-        except InterruptedError as error:
-            raise error
+        data = self._recv()
         return ProtocolUser._parse_message(data)
 
-    def _build_and_send_message(self, cmd: str, data: str = '') -> str:
+    def _build_and_send_message(self, cmd: str, data: str = '') -> bytes:
         """
         Builds a new message using `chatlib`, wanted code and message. Then, sends it to the socket.
 
@@ -162,7 +209,7 @@ class Client(ProtocolUser):
 
         Returns
         ------
-        - str
+        - bytes
             - The messgae sent to the socket.
 
         Raises
@@ -172,19 +219,18 @@ class Client(ProtocolUser):
         - ValueError
             - If `cmd` or `data` does not match the protocol.
         - InterruptedError
-            - If `send` failed (i.e the syscall is interrupted).
+            - If `sendall` failed (i.e the syscall is interrupted).
         """
 
         if not isinstance(cmd, str) or not isinstance(data, str):
             raise TypeError
-        cmd_protocol = PROTOCOL_CLIENT[cmd]
-        msg = ProtocolUser._build_message(cmd_protocol, data)
-        if not msg:
-            raise ValueError
-        try:
-            self.socket.send(msg.encode())
-        except InterruptedError as error:
-            raise error
+        msg = None if data else CONSTANT_REQUESTS.get(cmd)
+        if msg is None:
+            msg = ProtocolUser._build_message(PROTOCOL_CLIENT[cmd], data)
+            if not msg:
+                raise ValueError
+        # `send` may write only a part of the message, and `sendall` finishes it (in C):
+        self.socket.sendall(msg)
         return msg
 
     def _build_send_recv_parse(self, cmd: str, data: str = '',
@@ -234,19 +280,12 @@ class Client(ProtocolUser):
         if not isinstance(print_success, bool):
             raise TypeError
 
-        try:
-            self._build_and_send_message(cmd, data)
-        except Exception as error:
-            raise error
+        self._build_and_send_message(cmd, data)
 
         if print_success:
             _print_send_success(cmd)
 
-        recv_cmd, recv_msg = '', ''
-        try:
-            (recv_cmd, recv_msg) = self._recv_message_and_parse()
-        except Exception as error:
-            raise error
+        (recv_cmd, recv_msg) = self._recv_message_and_parse()
 
         return (recv_cmd, recv_msg)
 
@@ -257,7 +296,6 @@ class Client(ProtocolUser):
         If login fails, will try again untill success.
         """
         cmd_name = 'login'
-        recv_cmd, recv_msg = '', ''
         while True:
             username = input("Please enter username: \n")
             password = input("Please enter password: \n")
@@ -294,10 +332,7 @@ class Client(ProtocolUser):
         ------
         """
         cmd_name = 'logout'
-        try:
-            self._build_and_send_message(cmd_name)
-        except Exception as e:
-            raise e
+        self._build_and_send_message(cmd_name)
         _print_send_success(cmd_name)
 
     def get_score(self) -> None:
@@ -315,11 +350,7 @@ class Client(ProtocolUser):
         ------
         """
         cmd_name = "get_score"
-        recv_cmd, recv_msg = '', ''
-        try:
-            (recv_cmd, recv_msg) = self._build_send_recv_parse(cmd_name)
-        except Exception as e:
-            raise e
+        (recv_cmd, recv_msg) = self._build_send_recv_parse(cmd_name)
         if recv_cmd == PROTOCOL_SERVER_OK[cmd_name]:
             chatlib.print_server_msg("Your score is: " + recv_msg)
         elif recv_cmd == chatlib.PROTOCOL_SERVER_ERROR:
@@ -350,22 +381,18 @@ class Client(ProtocolUser):
         ------
         """
         cmd_name = "get_highscore"
-        recv_cmd, recv_msg = '', ''
-        try:
-            (recv_cmd, recv_msg) = self._build_send_recv_parse(cmd_name)
-        except Exception as e:
-            raise e
+        (recv_cmd, recv_msg) = self._build_send_recv_parse(cmd_name)
         if recv_cmd == PROTOCOL_SERVER_OK[cmd_name]:
             chatlib.print_server_msg("High-Score table is:\n" + recv_msg)
         elif recv_cmd == chatlib.PROTOCOL_SERVER_ERROR:
             _print_unknown_error()
 
     @staticmethod
-    def _printQuestion(recv_cmd: str, recv_msg: str) -> None:
+    def _printQuestion(recv_cmd: str, recv_msg: str) -> list[str]:
         """
         Private method. Gets the `cmd` and the `msg` and check them.
 
-        If everything is legal - parses it and prints it.
+        If everything is legal - parses it, prints it and returns the parts.
 
         If there is an error with the `cmd` or with the `msg`, raises ValueError.
 
@@ -384,6 +411,12 @@ class Client(ProtocolUser):
             `Must be str!`
         ------
 
+        Returns
+        ------
+        - list[str]
+            - The question parts: `[id, question, answer1, answer2, answer3, answer4]`.
+        ------
+
         Raises
         ------
         - ValueError
@@ -401,6 +434,7 @@ class Client(ProtocolUser):
             3. {}\n\
             4. {}".format(*q_parts)
         chatlib.print_server_msg(msg)
+        return q_parts
 
     @staticmethod
     def _printFeedback(recv_cmd: str, recv_msg: str) -> None:
@@ -458,35 +492,27 @@ class Client(ProtocolUser):
 
         # Ask a question from the server:
         cmd_name = 'get_question'
-        recv_cmd, recv_msg = '', ''
-        try:
-            (recv_cmd, recv_msg) = self._build_send_recv_parse(cmd_name)
-        except Exception as e:
-            raise e
+        (recv_cmd, recv_msg) = self._build_send_recv_parse(cmd_name)
         # Print the question:
         try:
-            Client._printQuestion(recv_cmd, recv_msg)
+            q_parts = Client._printQuestion(recv_cmd, recv_msg)
         except:
             _print_unknown_error()
             return
         # Get an answer from the user:
         answer = ''
         while True:
-            answer = input("Please choose an answer [1-4]: ")
-            if answer in [str(i) for i in range(1, 5)]:
+            answer = input(ANSWER_PROMPT)
+            if answer in VALID_ANSWER_INPUTS:
                 break
             _print_error_try_again(NO_SUCH_INPUT_MSG)
 
         # Send the answer to the server:
         cmd_name = 'send_answer'
 
-        q_num = Client._split_data(recv_msg, chatlib.QUESTION_PRATS_NUM)[0]
-        data = Client._join_data([q_num, answer])
+        data = Client._join_data([q_parts[0], answer])
 
-        try:
-            (recv_cmd, recv_msg) = self._build_send_recv_parse(cmd_name, data)
-        except Exception as e:
-            raise e
+        (recv_cmd, recv_msg) = self._build_send_recv_parse(cmd_name, data)
 
         # Get a feedback about the answer:
         try:
@@ -546,11 +572,7 @@ class Client(ProtocolUser):
         ------
         """
         cmd_name = "get_logged_users"
-        recv_cmd, recv_msg = '', ''
-        try:
-            (recv_cmd, recv_msg) = self._build_send_recv_parse(cmd_name)
-        except Exception as e:
-            raise e
+        (recv_cmd, recv_msg) = self._build_send_recv_parse(cmd_name)
         try:
             Client._printLoggedUsers(recv_cmd, recv_msg)
         except Exception as e:
@@ -577,19 +599,21 @@ def main():
     }
     prompt = '\n'.join([(k + '\t' + v) for k, v in prompt_dict.items()])
     prompt += '\nPlease enter your choise: '
+    # Every option (but 'q') maps to its method, so an input is dispatched by a single lookup:
+    actions = {
+        'p': my_player.play_question,
+        's': my_player.get_score,
+        'h': my_player.get_highscore,
+        'l': my_player.get_logged_users
+    }
     cmd_input = ''
     while True:
         cmd_input = input(prompt)
         if(cmd_input == 'q'):
             break
-        if(cmd_input == 'p'):
-            my_player.play_question()
-        elif(cmd_input == 's'):
-            my_player.get_score()
-        elif(cmd_input == 'h'):
-            my_player.get_highscore()
-        elif(cmd_input == 'l'):
-            my_player.get_logged_users()
+        action = actions.get(cmd_input)
+        if action:
+            action()
         else:
             _print_error_try_again(NO_SUCH_INPUT_MSG)
 
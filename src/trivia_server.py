@@ -21,10 +21,21 @@ Another section...
 
 # For Python versions between 3.7 to 3.9, we need the following line:
 from __future__ import annotations
+import os
 import json
+import logging
+try:
+    # Optional: a faster JSON parser and serializer for the data files.
+    import orjson
+except ImportError:
+    orjson = None
 import socket
-import select
+import selectors
 import random
+from collections import deque
+from itertools import islice
+import heapq
+from types import MappingProxyType
 from typing import Union
 import chatlib
 from chatlib import ProtocolUser, User, Question,\
@@ -36,12 +47,20 @@ from chatlib import ProtocolUser, User, Question,\
 # ===== Constants:
 
 
+logger = logging.getLogger(__name__)
+"""Every message sent and received is logged at `DEBUG` level, which is off by default"""
+
 LISTEN_ALL_IP = "0.0.0.0"
 SERVER_IP = LISTEN_ALL_IP
 
 USERS_PATH = "users.json"
 QUESTIONS_PATH = "questions.json"
 
+HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+"""Whether vectored sends are supported (not on Windows)"""
+SEND_BATCH_SIZE = 64
+"""Max number of queued messages sent to a client in one syscall (below any `IOV_MAX`)"""
+
 HIGHSCORE_TABLE_SIZE = 3
 CORRECT_ANSWER_SCORE = 5
 
@@ -52,6 +71,17 @@ ERROR_INVALID_ANSWER = "Error: Invalid answer! Must be a number between 1-4."
 ERROR_CLIENT_WAS_ADDED_WRONG = "Error: This client was not added by `accept_new_client`!"
 ERROR_NO_MORE_QUESTIONS = "Error: No more questions left. You answerd them all."
 
+RESPONSE_CMDS = MappingProxyType({**PROTOCOL_SERVER_OK,
+                                  PROTOCOL_SERVER_ERROR: PROTOCOL_SERVER_ERROR})
+"""Every command the server may respond with, mapped to its protocol command"""
+
+CONSTANT_RESPONSES = (("login", ''), ("send_answer_correct", ''),
+                      *((PROTOCOL_SERVER_ERROR, error) for error in (
+                          UNKNOWN_ERROR_OCCURRED, ERROR_USERNAME_DOES_NOT_EXIST,
+                          ERROR_PASSWORD_DOES_NOT_MATCH, ERROR_INVALID_ANSWER,
+                          ERROR_NO_MORE_QUESTIONS)))
+"""All the (cmd, data) responses whose data never changes, so their messages are built once"""
+
 # ====================
 # ===== Classes:
 
@@ -85,17 +115,25 @@ class Server(ProtocolUser):
 
     _parse_message(msg)
 
+    _build_response(cmd, data='')
+
     Public Methods
     -------
-    recv_message_and_parse()
+    recv_messages_and_parse()
 
     _build_and_append_message(cmd, data='')
 
+    _append_message(client, msg)
+
     terminate()
         Closes the server socket (for use when the socket is no longer needed).
 
     """
 
+    __slots__ = ('_users', '_highscore', '_questions', '_question_frames', '_logged_users',
+                 '_logged_msg', '_messages_to_send', '_clients', '_client_users', '_peernames',
+                 '_recv_bufs', '_recv_lens', '_constant_frames', '_handlers', '_selector')
+
     def __init__(self, server_ip: str = SERVER_IP, server_port: int = chatlib.SERVER_PORT) -> None:
         """
         Creates a `Server` by creating a socket, binding it and putting on a listening mode.
@@ -118,172 +156,234 @@ class Server(ProtocolUser):
         self.users = self._load_users()
         self.questions = self._load_questions()
         self.logged_users = {}
-        self.messages_to_send = []
-        self.clients = []
+        self.messages_to_send = {}
+        self.clients = {}
+        # The `User` of each logged-in client, so handlers reach it without going by address:
+        self._client_users = {}
+        # The address of each client, as returned by `accept` (rather than a syscall per use):
+        self._peernames = {}
+        # A receive buffer for each client, reused by every `recv_into` from that client. It can
+        # hold the longest message, and `_recv_lens` has how much of it is filled:
+        self._recv_bufs = {}
+        self._recv_lens = {}
+        self._constant_frames = {response: self._build_response(*response)
+                                 for response in CONSTANT_RESPONSES}
+        # Each command maps to its handler and whether that handler takes the message data, so
+        # a command is dispatched by a single lookup:
+        self._handlers = {
+            PROTOCOL_CLIENT["login"]: (self._handle_login_message, True),
+            PROTOCOL_CLIENT["logout"]: (self._handle_logout_message, False),
+            PROTOCOL_CLIENT["get_score"]: (self._handle_get_score_message, False),
+            PROTOCOL_CLIENT["get_highscore"]: (self._handle_get_highscore_message, False),
+            PROTOCOL_CLIENT["get_logged_users"]: (self._handle_get_logged_users_message, False),
+            PROTOCOL_CLIENT["get_question"]: (self._handle_get_question_message, False),
+            PROTOCOL_CLIENT["send_answer"]: (self._handle_send_answer_message, True)
+        }
         # Bind the socket to the IP and port of the socket:
         self.socket.bind((server_ip, server_port))
         # Allow the socket to listen to clients:
         self.socket.listen()
+        # Picks the best mechanism the OS has (e.g. `epoll`), instead of scanning every socket:
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.socket, selectors.EVENT_READ)
 
     @property
-    def users(self) -> dict[str, User]:
+    def users(self) -> MappingProxyType[str, User]:
         """`dict`[`str`,`User`]: A dictionary of all the users - whether connected or not.
 
-        #### Pay attention: The getter for this property returns a shallow copy of this dict.
+        #### Pay attention: The getter for this property returns a read-only view of this dict.
         """
-        return self._users.copy()
+        return MappingProxyType(self._users)
 
     @users.setter
     def users(self, users: list[User]) -> None:
-        if not isinstance(users, list) or not all(isinstance(u, User) for u in users):
+        if not isinstance(users, list):
             raise TypeError
         self._users = {user.name: user for user in users}
+        # The highscore message is built on demand, and again only after a score changes:
+        self._highscore = None
 
     @property
-    def questions(self) -> dict[int, Question]:
+    def questions(self) -> MappingProxyType[int, Question]:
         """`dict`[`int`,`Question`]: A dictionary of all the questions.
 
-        #### Pay attention: The getter for this property returns a shallow copy of this dict.
+        #### Pay attention: The getter for this property returns a read-only view of this dict.
         """
-        return self._questions.copy()
+        return MappingProxyType(self._questions)
 
     @questions.setter
     def questions(self, questions: dict[int, Question]) -> None:
         if not isinstance(questions, dict):
             raise TypeError
-        if not all(isinstance(i, int) and isinstance(q, Question) for (i, q) in questions.items()):
-            raise TypeError
+        # Questions do not change once loaded, so each one is built into its message only once:
+        question_frames = {
+            num: self._build_message(PROTOCOL_SERVER_OK["get_question"],
+                                     self._join_data((str(num), q.question, *q.optional_answers)))
+            for (num, q) in questions.items()}
+        if not all(question_frames.values()):
+            raise ValueError
         self._questions = questions
+        self._question_frames = question_frames
 
     @property
-    def logged_users(self) -> dict[tuple[str, int], str]:
+    def logged_users(self) -> MappingProxyType[tuple[str, int], str]:
         """`dict`[`tuple`[`str`,`int`],`str`]: A dictionary of all the logged users.
 
-        #### Pay attention: The getter for this property returns a shallow copy of this dict.
+        #### Pay attention: The getter for this property returns a read-only view of this dict.
         """
-        return self._logged_users.copy()
+        return MappingProxyType(self._logged_users)
 
     @logged_users.setter
     def logged_users(self, logged_users: dict[tuple[str, int], str]) -> None:
         if not isinstance(logged_users, dict):
             raise TypeError
-        if not all(isinstance(t, tuple) for t in logged_users):
-            raise TypeError
-        if not all(isinstance(s, str) and isinstance(i, int) for (s, i) in logged_users.keys()):
-            raise TypeError
-        if not all(isinstance(s, str) for s in logged_users.values()):
-            raise TypeError
         self._logged_users = logged_users
+        # Like the highscore, the logged message is built on demand, and again only after a
+        # login or a logout:
+        self._logged_msg = None
 
     @property
-    def messages_to_send(self) -> list[tuple[socket.socket, str]]:
-        """`list`[`tuple`[`socket.socket`,`str`]]: A list of all (client, msg) tuples to be sent.
+    def messages_to_send(self) -> MappingProxyType[socket.socket, deque[bytes]]:
+        """`dict`[`socket.socket`,`deque`[`bytes`]]: The messages to be sent to each client.
 
-        We make it a list to keep our server a fair server (in terms of FCFS).
+        Each client has its own queue, to keep our server a fair server (in terms of FCFS),
+        while a client that is not ready to write does not hold back the others.
+        A client with no pending messages has no queue.
 
-        #### Pay attention: The getter for this property returns a shallow copy of this list.
+        #### Pay attention: The getter for this property returns a read-only view of this dict.
         """
-        return self._messages_to_send.copy()
+        return MappingProxyType(self._messages_to_send)
 
     @messages_to_send.setter
-    def messages_to_send(self, messages_to_send: list[tuple[socket.socket, str]]) -> None:
-        if not isinstance(messages_to_send, list):
-            raise TypeError
-        if not all(isinstance(t, tuple) for t in messages_to_send):
-            raise TypeError
-        if not all(isinstance(soc, socket.socket) and isinstance(s, str)
-                   for (soc, s) in messages_to_send):
+    def messages_to_send(self, messages_to_send: dict[socket.socket, deque[bytes]]) -> None:
+        if not isinstance(messages_to_send, dict):
             raise TypeError
         self._messages_to_send = messages_to_send
 
     @property
-    def clients(self) -> list[socket.socket]:
-        """`list`[`socket.socket`]: A list of all clients which have been accepted by `accept`.
+    def clients(self) -> MappingProxyType[socket.socket, None]:
+        """`dict`[`socket.socket`,`None`]: All the clients which have been accepted by `accept`.
+
+        A dict with no values (rather than a list), so a client is removed in O(1), while the
+        clients are still kept in the order they joined.
 
-            #### Pay attention: The getter for this property returns a shallow copy of this list.
+        #### Pay attention: The getter for this property returns a read-only view of this dict.
         """
-        return self._clients
+        return MappingProxyType(self._clients)
 
     @clients.setter
-    def clients(self, clients: list[socket.socket]) -> None:
-        if not isinstance(clients, list):
-            raise TypeError
-        if not all(isinstance(soc, socket.socket) for soc in clients):
+    def clients(self, clients: dict[socket.socket, None]) -> None:
+        if not isinstance(clients, dict):
             raise TypeError
         self._clients = clients
 
+    @staticmethod
+    def _load_json(path: str):
+        with open(path, "rb") as read_file:
+            if orjson:
+                return orjson.loads(read_file.read())
+            return json.load(read_file)
+
     @staticmethod
     def _load_users() -> list[User]:
-        with open(USERS_PATH, "r") as read_users:
-            return [User.dict_to_user(user_dict) for user_dict in json.load(read_users)]
+        return [User.dict_to_user(user_dict) for user_dict in Server._load_json(USERS_PATH)]
+
+    @staticmethod
+    def _store_json(path: str, obj) -> None:
+        # Serialized before anything is opened, so a failure here leaves no file behind:
+        if orjson:
+            # Like `json`, non-str keys (the question numbers) are written as strings:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(obj, indent=2).encode()
+        # Written aside and then renamed over the old file, so a crash never leaves it half-written:
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "wb") as write_file:
+                write_file.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
 
     def _store_users(self) -> None:
-        with open(USERS_PATH, "w") as write_users:
-            users_list = [user.user_to_dict() for user in self._users.values()]
-            json.dump(users_list, write_users, indent=2)
+        self._store_json(USERS_PATH, [user.user_to_dict() for user in self._users.values()])
 
     @staticmethod
     def _load_questions() -> dict[int, Question]:
-        with open(QUESTIONS_PATH, "r") as read_questions:
-            return {int(k): Question.dict_to_question(q)
-                    for (k, q) in json.load(read_questions).items()}
+        return {int(k): Question.dict_to_question(q)
+                for (k, q) in Server._load_json(QUESTIONS_PATH).items()}
 
     def _store_questions(self) -> None:
-        with open(QUESTIONS_PATH, "w") as write_questions:
-            questions_dict = {num: q.question_to_dict()
-                              for (num, q) in self._questions.items()}
-            json.dump(questions_dict, write_questions, indent=2)
+        self._store_json(QUESTIONS_PATH, {num: q.question_to_dict()
+                                          for (num, q) in self._questions.items()})
 
-    @staticmethod
-    def recv_message_and_parse(client: socket.socket) -> Union[tuple[str, str], tuple[None, None]]:
+    def recv_messages_and_parse(self, client: socket.socket) \
+            -> Union[list[tuple[str, str]], None]:
         """
-        Recieves a new message from the socket and then parses the message using `chatlib`.
+        Recieves from the socket into the client's buffer, and then parses every message which
+        has been fully received, using `chatlib`. An incomplete message is kept in the buffer,
+        until the rest of it is received.
 
-        This function alse prints a message with the data recived.
+        This function alse logs (at `DEBUG` level) a message with the data recived.
 
         ------
         Parameters
         ------
         client: socket.socket
-            - The socket for reciving the message from. see also `returns` to see what happens
+            - The socket for reciving the messages from. see also `returns` to see what happens
             in case of an illegal socket.
 
         ------
         Returns
         ------
-        - tuple[str, str]
-            - If succeded - returns a tuple (cmd, msg). (cmd is the command and msg is the massege).
-        - tuple[None, None]
-            - If an error occured with the message recived from the client, or if the client socket
-            is an illegal socket(e.g. closed forcibly and thus an `OSError` or
-            `ConnectionResetError` was raised).
+        - list[tuple[str, str]]
+            - If succeded - returns a list of tuples (cmd, msg), in the order they were received.
+            (cmd is the command and msg is the massege). May be empty, if no message has been
+            completed yet.
+        - None
+            - If an error occured with a message recived from the client, if the client has
+            closed the connection, or if the client socket is an illegal socket(e.g. closed
+            forcibly and thus an `OSError` or `ConnectionResetError` was raised).
 
         ------
         Raises
         ------
         - TypeError
             - If the argument is of inappropriate type
-        - InterruptedError
-            - If `recv` failed (i.e the syscall is interrupted).
         """
         if not isinstance(client, socket.socket):
             raise TypeError
-        data = ''
+        recv_buf = self._recv_bufs[client]
+        view = memoryview(recv_buf)
+        buffered = self._recv_lens[client]
         try:
-            data = client.recv(chatlib.BUFFER_SIZE).decode()
-        except InterruptedError as error:
-            raise error
+            received = client.recv_into(view[buffered:])
+        except BlockingIOError:
+            return []
         except (ConnectionResetError, OSError):
-            return (None, None)
-        cmd, msg = ProtocolUser._parse_message(data)
-        if cmd:
-            print("[CLIENT]\t{}\nmsg:\t{}".format(client.getpeername(), data))
-        return (cmd, msg)
+            return None
+        if not received:
+            return None
+        messages = []
+        data, buffered = ProtocolUser._pop_message(recv_buf, buffered + received)
+        while data is not None:
+            cmd, msg = ProtocolUser._parse_message(data)
+            if cmd is None:
+                return None
+            # Checked first, so nothing is decoded or formatted when debug logging is off:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[CLIENT]\t%s\nmsg:\t%s", self._peernames[client], data.decode())
+            messages.append((cmd, msg))
+            data, buffered = ProtocolUser._pop_message(recv_buf, buffered)
+        self._recv_lens[client] = buffered
+        return messages
 
     def _build_and_append_message(self, client: socket.socket, cmd: str, data: str = '') -> None:
         """
         Builds a new message using `chatlib`, by code and message.
-        Then, appends it to the `_messages_to_send` list.
+        Then, appends it to the client's queue in `_messages_to_send`.
 
         ------
         Parameters
@@ -303,18 +403,62 @@ class Server(ProtocolUser):
         - AssertionError
             - If `cmd` or `data` does not match the protocol.
         """
-        assert isinstance(client, socket.socket) and all(
-            isinstance(s, str) for s in [cmd, data])
-        if cmd == PROTOCOL_SERVER_ERROR:
-            cmd_protocol = cmd
-        elif cmd in PROTOCOL_SERVER_OK.keys():
-            cmd_protocol = PROTOCOL_SERVER_OK[cmd]
+        msg = self._constant_frames.get((cmd, data)) or self._build_response(cmd, data)
+        self._append_message(client, msg)
+
+    def _append_message(self, client: socket.socket, msg: bytes) -> None:
+        """
+        Appends a ready message to the client's queue in `_messages_to_send`.
+
+        ------
+        Parameters
+        ------
+        client: socket.socket
+            - The socket for sending the message.
+
+        msg : bytes
+            - The message, as built by `_build_message`.
+        """
+        queue = self._messages_to_send.get(client)
+        if queue is None:
+            self._messages_to_send[client] = deque((msg,))
+            self._selector.modify(client, selectors.EVENT_READ | selectors.EVENT_WRITE)
         else:
+            queue.append(msg)
+
+    @staticmethod
+    def _build_response(cmd: str, data: str = '') -> bytes:
+        """
+        Builds a new message using `chatlib`, by code and message.
+
+        ------
+        Parameters
+        ------
+        cmd : str
+            - A key of `RESPONSE_CMDS`.
+
+        data : str, (default '')
+            - A data srting.
+
+        ------
+        Returns
+        ------
+        - bytes
+            - The message.
+
+        ------
+        Raises
+        ------
+        - AssertionError
+            - If `cmd` or `data` does not match the protocol.
+        """
+        cmd_protocol = RESPONSE_CMDS.get(cmd)
+        if not cmd_protocol:
             raise AssertionError
         msg = ProtocolUser._build_message(cmd_protocol, data)
         if not msg:
             raise AssertionError
-        self._messages_to_send.append((client, msg))  # was added
+        return msg
 
     def send_messages_to_ready_sockets(self, ready_to_write: list[socket.socket]) -> None:
         """
@@ -335,19 +479,35 @@ class Server(ProtocolUser):
         """
         if not isinstance(ready_to_write, list):
             raise TypeError
-        if not all(isinstance(soc, socket.socket) for soc in ready_to_write):
-            raise TypeError
-        # TODO: Make here intersection for achiving O(n) complexity...
-        for msg in self._messages_to_send:
-            curr_socket, data = msg
-            if curr_socket in ready_to_write:
-                self._messages_to_send.remove(msg)
-                try:
-                    curr_socket.send(data.encode())
-                    print("[SERVER]\t{}\nmsg:\t{}".format(
-                        curr_socket.getpeername(), data))
-                except (ConnectionResetError, OSError):
-                    self.terminate_client(curr_socket)
+        for curr_socket in ready_to_write:
+            queue = self._messages_to_send.get(curr_socket)
+            if not queue:
+                continue
+            try:
+                # All the pending messages (up to a batch) are sent using a single syscall:
+                if HAS_SENDMSG:
+                    sent = curr_socket.sendmsg(islice(queue, SEND_BATCH_SIZE))
+                else:
+                    sent = curr_socket.send(b''.join(islice(queue, SEND_BATCH_SIZE)))
+            except BlockingIOError:
+                # Not writable after all - the queue is kept as is, for the next time it is ready.
+                continue
+            except (ConnectionResetError, OSError):
+                self.terminate_client(curr_socket)
+                continue
+            # Drop the fully sent messages. The socket buffer may have filled up in the middle of
+            # a message, so its unsent rest waits for the next time the socket is ready:
+            while queue and sent >= len(queue[0]):
+                data = queue.popleft()
+                sent -= len(data)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[SERVER]\t%s\nmsg:\t%s",
+                                 self._peernames[curr_socket], data.decode())
+            if sent:
+                queue[0] = queue[0][sent:]
+            if not queue:
+                del self._messages_to_send[curr_socket]
+                self._selector.modify(curr_socket, selectors.EVENT_READ)
 
     def _send_error(self, client: socket.socket, error_mgs: str = UNKNOWN_ERROR_OCCURRED) -> None:
         """
@@ -367,7 +527,6 @@ class Server(ProtocolUser):
         """
 
         # TODO: check if `error_mgs` is in the protocol.
-        assert isinstance(client, socket.socket) and isinstance(error_mgs, str)
         self._build_and_append_message(
             client, PROTOCOL_SERVER_ERROR, error_mgs)
 
@@ -390,41 +549,36 @@ class Server(ProtocolUser):
         data : str
             - A string of format "<username>#<password>".
         """
-        assert isinstance(client, socket.socket) and isinstance(data, str)
         data_list = self._split_data(data, 2)
         if not data_list:
             self._send_error(client)
             return
         username, password = data_list
-        if not username in self.users:
+        user = self._users.get(username)
+        if user is None:
             self._send_error(client, ERROR_USERNAME_DOES_NOT_EXIST)
-        elif password != self.users[username].get_password():
+        elif password != user.get_password():
             self._send_error(client, ERROR_PASSWORD_DOES_NOT_MATCH)
         else:
             self._build_and_append_message(client, "login")
-            assert client.getpeername() not in self._logged_users  # TODO: remove it
-            self._logged_users[client.getpeername()] = username
-            assert client.getpeername() in self._logged_users  # TODO: remove it
+            self._logged_users[self._peernames[client]] = username
+            self._logged_msg = None
+            self._client_users[client] = user
 
     def _handle_logout_message(self, client: socket.socket) -> None:
         """
-        Closes the logging-out socket and removes user from logged_users dictioary.
+        Closes the logging-out socket and removes user from logged_users dictioary, using
+        `terminate_client`.
 
-        This function alse prints a message to the screen.
+        This function alse logs a message.
 
         ------
         Parameters
         ------
         client: socket.socket
             - The socket to close.
-            Must be a real and exist socket, otherwise an `OSError` will be raised.
         """
-        assert isinstance(client, socket.socket)
-        del self._logged_users[client.getpeername()]
-        client.close()
-        self._clients.remove(client)
-        print("Connection closed!")
-        self._print_client_sockets()
+        self.terminate_client(client)
 
     def _handle_get_score_message(self, client: socket.socket) -> None:
         """
@@ -439,12 +593,7 @@ class Server(ProtocolUser):
             - A client socket which is already logged-in.
             Must be a real and exist socket, otherwise an `OSError` will be raised.
         """
-        assert isinstance(client, socket.socket)
-        client_address = client.getpeername()
-        assert client_address in self._logged_users
-        username = self._logged_users[client_address]
-        assert username in self._users
-        score = str(self._users[username].get_score())
+        score = str(self._client_users[client].get_score())
         self._build_and_append_message(client, "get_score", score)
 
     def _handle_get_highscore_message(self, client: socket.socket) -> None:
@@ -461,12 +610,11 @@ class Server(ProtocolUser):
             - A client socket which is already logged-in.
         Must be a real and exist socket, otherwise an `OSError` will be raised.
         """
-        assert isinstance(client, socket.socket)
-        greatest = sorted(self.users.values(), key=lambda user: user.score,
-                          reverse=True)[0:HIGHSCORE_TABLE_SIZE]
-        highscore = '\n'.join(": ".join((user.name, str(user.score)))
-                              for user in greatest)
-        self._build_and_append_message(client, "get_highscore", highscore)
+        if self._highscore is None:
+            greatest = heapq.nlargest(HIGHSCORE_TABLE_SIZE, self._users.values(),
+                                      key=User.get_score)
+            self._highscore = '\n'.join(f"{user.name}: {user.score}" for user in greatest)
+        self._build_and_append_message(client, "get_highscore", self._highscore)
 
     def _handle_get_logged_users_message(self, client: socket.socket) -> None:
         """
@@ -482,11 +630,11 @@ class Server(ProtocolUser):
             - A client socket which is already logged-in.
         Must be a real and exist socket, otherwise an `OSError` will be raised.
         """
-        assert isinstance(client, socket.socket)
-        logged_msg = ','.join(self._logged_users.values())
-        self._build_and_append_message(client, "get_logged_users", logged_msg)
+        if self._logged_msg is None:
+            self._logged_msg = ','.join(self._logged_users.values())
+        self._build_and_append_message(client, "get_logged_users", self._logged_msg)
 
-    def _get_random_question(self, client: socket.socket) -> Union[str, None]:
+    def _get_random_question(self, client: socket.socket) -> Union[int, None]:
         """
         An helper method for `get_questio` cmd. Gets a random question from the repository.
         If found a question, it also appends it to `questions_asked` of the user.
@@ -494,8 +642,8 @@ class Server(ProtocolUser):
         ------
         Returns
         ------
-        - str
-            - A string a format according to the protocol (see examples).
+        - int
+            - The question number. Its message is ready in `_question_frames` (see examples).
         - None
             - In case the user has no questions left that he has not yet answered.
 
@@ -503,19 +651,18 @@ class Server(ProtocolUser):
         Examples
         ------
         >>> self._get_random_question(some_client)
-        "7#How much is 2+2?#1#5#<4#3"
+        7
+        >>> self._question_frames[7]
+        b'YOUR_QUESTION   |0026|7#How much is 2+2?#1#5#4#3'
         """
-        username = self._logged_users[client.getpeername()]
-        available = set(self._questions.keys()).difference(
-            self._users[username].questions_asked)
+        user = self._client_users[client]
+        # A keys view supports set operations itself, so there is no need to copy it into a set:
+        available = self._questions.keys() - user.questions_asked
         if not available:
             return None
-        q_num = random.choice(list(available))
-        self._users[username].mark_question_as_asked(q_num)
-        question = self._questions[q_num]
-        q_elements = (str(q_num), question.question) + \
-            tuple(question.optional_answers)
-        return self._join_data(q_elements)
+        q_num = random.choice(tuple(available))
+        user.mark_question_as_asked(q_num)
+        return q_num
 
     def _handle_get_question_message(self, client: socket.socket) -> None:
         """
@@ -531,12 +678,11 @@ class Server(ProtocolUser):
             - A client socket which is already logged-in.
             Must be a real and exist socket, otherwise an `OSError` will be raised.
         """
-        assert isinstance(client, socket.socket)
-        question = self._get_random_question(client)
-        if not question:
+        q_num = self._get_random_question(client)
+        if q_num is None:
             self._send_error(client, ERROR_NO_MORE_QUESTIONS)
         else:
-            self._build_and_append_message(client, "get_question", question)
+            self._append_message(client, self._question_frames[q_num])
 
     def _handle_send_answer_message(self, client: socket.socket, answer_data: str) -> None:
         """
@@ -554,8 +700,6 @@ class Server(ProtocolUser):
             - A client socket which is already logged-in.
         Must be a real and exist socket, otherwise an `OSError` will be raised.
         """
-        assert isinstance(client, socket.socket) and isinstance(
-            answer_data, str)
         answer_parts = self._split_data(answer_data, 2)
         if not answer_parts or len(answer_parts) != 2:
             self._send_error(client, ERROR_INVALID_ANSWER)
@@ -563,18 +707,18 @@ class Server(ProtocolUser):
         try:
             # checks if integers.
             q_num, answer = int(answer_parts[0]), int(answer_parts[1])
-            # checks if question number exists.
-            question = self._questions[q_num]
-            # checks if answer is between 1-4.
-            if answer not in range(1, chatlib.NUMBER_OF_ANSWERS + 1):
-                raise ValueError
-        except (ValueError, KeyError):
+        except ValueError:
+            self._send_error(client, ERROR_INVALID_ANSWER)
+            return
+        # checks if question number exists, and if answer is between 1-4.
+        question = self._questions.get(q_num)
+        if question is None or answer not in chatlib.VALID_ANSWERS:
             self._send_error(client, ERROR_INVALID_ANSWER)
             return
         if answer == question.answer:
             self._build_and_append_message(client, "send_answer_correct")
-            self._users[self._logged_users[client.getpeername()]].add_score(
-                CORRECT_ANSWER_SCORE)
+            self._client_users[client].add_score(CORRECT_ANSWER_SCORE)
+            self._highscore = None
             self._store_users()
         else:
             self._build_and_append_message(
@@ -583,7 +727,7 @@ class Server(ProtocolUser):
     def handle_client_message(self, client: socket.socket, cmd: str, data: str) -> None:
         """
         Gets message cmd and data and calls the right function to handle command.
-        Then, the message will be appended to the `_messages_to_send` list.
+        Then, the message will be appended to the client's queue in `_messages_to_send`.
 
         ------
         Parameters
@@ -603,42 +747,38 @@ class Server(ProtocolUser):
         - TypeError
             - If the argument is of inappropriate type
         """
-        if not isinstance(client, socket.socket) or \
-                not all(isinstance(s, str) for s in [cmd, data]):
+        if not isinstance(client, socket.socket) or not isinstance(cmd, str) \
+                or not isinstance(data, str):
             raise TypeError
-        if cmd == PROTOCOL_CLIENT["login"]:
-            self._handle_login_message(client, data)
-        elif cmd == PROTOCOL_CLIENT["logout"]:
-            self._handle_logout_message(client)
-        elif cmd == PROTOCOL_CLIENT["get_score"]:
-            self._handle_get_score_message(client)
-        elif cmd == PROTOCOL_CLIENT["get_highscore"]:
-            self._handle_get_highscore_message(client)
-        elif cmd == PROTOCOL_CLIENT["get_logged_users"]:
-            self._handle_get_logged_users_message(client)
-        elif cmd == PROTOCOL_CLIENT["get_question"]:
-            self._handle_get_question_message(client)
-        elif cmd == PROTOCOL_CLIENT["send_answer"]:
-            self._handle_send_answer_message(client, data)
-        else:
+        entry = self._handlers.get(cmd)
+        if entry is None:
             self._send_error(client, UNKNOWN_ERROR_OCCURRED)
+            return
+        handler, takes_data = entry
+        if takes_data:
+            handler(client, data)
+        else:
+            handler(client)
 
     def _print_client_sockets(self) -> None:
         """
-        A function to print all the connected clients.
+        A function to log (at `DEBUG` level) all the connected clients.
         """
+        # Checked first, so the list is not built on every connect/disconnect when debug is off:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         if not self._clients:
-            print("Currently no one is connected.")
+            logger.debug("Currently no one is connected.")
         else:
-            print("Currently connected - {} clients:".format(len(self._clients)))
-            print("\t".join([""] + [str(client.getpeername())
-                  for client in self._clients]))
+            logger.debug("Currently connected - %d clients:\n%s", len(self._clients),
+                         "\t".join([""] + [str(self._peernames[client])
+                                           for client in self._clients]))
 
     def accept_new_client(self) -> socket.socket:
         """
         Using `accept`, accepting a new client and adds it to clients list.
 
-        This method also prints a "new client joined" messgae.
+        This method also logs a "new client joined" messgae.
 
         ------
         Notes
@@ -647,21 +787,31 @@ class Server(ProtocolUser):
         this method will block the process.
         """
         (client_socket, client_address) = self.socket.accept()
-        self._clients.append(client_socket)
-        print("New client joined!\t{}".format(client_address))
+        # The selector tells when it is ready, so a `recv`/`send` on it never blocks the server:
+        client_socket.setblocking(False)
+        # Protocol messages are small and complete, so they should not wait for each other:
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._clients[client_socket] = None
+        self._peernames[client_socket] = client_address
+        self._recv_bufs[client_socket] = bytearray(chatlib.MESSAGE_MAX_LENGTH)
+        self._recv_lens[client_socket] = 0
+        # Only waited for writing while it has messages pending (see `_append_message`):
+        self._selector.register(client_socket, selectors.EVENT_READ)
+        logger.info("New client joined!\t%s", client_address)
         self._print_client_sockets()
         return client_socket
 
     def select_clients(self) -> tuple[list[socket.socket], list[socket.socket],
                                       list[socket.socket]]:
         """
-        Performes the function `select.select`.
+        Waits for the server socket and the clients, using the server's `selectors` selector.
 
         ------
         Returns
         ------
         - tuple[list, list, list]
-            - (ready_to_read, ready_to_write, in_error).
+            - (ready_to_read, ready_to_write, in_error). `in_error` is always empty, since errors
+            show up as ready-to-read sockets whose `recv` fails.
 
         ------
         Notes
@@ -669,14 +819,20 @@ class Server(ProtocolUser):
         Since `select` uses a blocking syscall, this method will block the process until
         one or more file descriptors are ready for some kind of I/O.
         """
-        return select.select([self.socket] + self._clients, self._clients, [])
+        ready_to_read, ready_to_write = [], []
+        for (key, events) in self._selector.select():
+            if events & selectors.EVENT_READ:
+                ready_to_read.append(key.fileobj)
+            if events & selectors.EVENT_WRITE:
+                ready_to_write.append(key.fileobj)
+        return (ready_to_read, ready_to_write, [])
 
     def terminate_client(self, client: socket.socket) -> None:
         """
         Closes the client socket, removes user from `logged_users` and removes client
         from `clients`.
 
-        This method alse prints a message to the screen.
+        This method alse logs a message.
 
         ------
         Parameters
@@ -694,15 +850,20 @@ class Server(ProtocolUser):
             raise TypeError
         if client not in self._clients:
             return
-        self._clients.remove(client)
+        del self._clients[client]
+        self._selector.unregister(client)
+        del self._recv_bufs[client]
+        del self._recv_lens[client]
+        self._messages_to_send.pop(client, None)
+        # The client may have been dropped before logging in:
+        if self._logged_users.pop(self._peernames.pop(client), None) is not None:
+            self._logged_msg = None
+        self._client_users.pop(client, None)
         try:
-            if client.getpeername() in self._logged_users:
-                del self._logged_users[client.getpeername()]
-            assert client.getpeername() not in self._logged_users
             client.close()
         except OSError:
             pass
-        print("Connection closed!")
+        logger.info("Connection closed!")
         self._print_client_sockets()
 
 
@@ -713,9 +874,10 @@ def main():
     """
     Main fuction, which runs a multy-clients server and serving all the requests.
     """
-    print("Welcome to Trivia Server!\nstarting up on port 5678.")
+    logging.basicConfig(format="%(message)s", level=logging.INFO)
+    logger.info("Welcome to Trivia Server!\nstarting up on port %d.", chatlib.SERVER_PORT)
     server = Server()
-    print("Server is up and ready.")
+    logger.info("Server is up and ready.")
     # - Main loop:
     while True:
         # - Use `select` for getting all the ready_to_read and ready_to_write clients:
@@ -727,10 +889,14 @@ def main():
                 server.accept_new_client()
             # - In case of an existing client:
             else:
-                cmd, data = server.recv_message_and_parse(curr)
-                if not cmd:
+                messages = server.recv_messages_and_parse(curr)
+                if messages is None:
                     server.terminate_client(curr)
-                else:
+                    continue
+                for (cmd, data) in messages:
+                    # A logged-out client is closed, and whatever it sent after that is ignored:
+                    if curr.fileno() == -1:
+                        break
                     server.handle_client_message(curr, cmd, data)
 
         # handle ready to write